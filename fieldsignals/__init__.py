@@ -1,3 +1,3 @@
-from .signals import pre_save_changed, post_save_changed  # noqa
+from .signals import pre_save_changed, post_save_changed, FieldSignalsMixin  # noqa
 
 __version__ = (0, 6, 0)
@@ -1,17 +1,502 @@
+import datetime
+import keyword
+import sys
+import textwrap
+import uuid
 from copy import deepcopy
+from decimal import Decimal
 
 from django.apps import apps
 from django.core.exceptions import AppRegistryNotReady
+from django.db.models.fields import Field
 from django.db.models.fields.related import ForeignObjectRel
 from django.db.models import signals as _signals
 from django.dispatch import Signal
+from django.dispatch.dispatcher import _make_id
 
-
-__all__ = ("pre_save_changed", "post_save_changed")
+__all__ = ("pre_save_changed", "post_save_changed", "FieldSignalsMixin")
 
 
 IMMUTABLE_TYPES_WHITELIST = tuple([tuple, frozenset, float, str, int])
 
+# Exact types which are known to be immutable. Checking type membership in this set
+# is cheaper than isinstance() against the whitelist, and covers most field values.
+_IMMUTABLE_EXACT_TYPES = frozenset(
+    [tuple, frozenset, float, str, int, bool, bytes, type(None)]
+)
+
+# Immutable types which can't contain other values. Containers are only shallow
+# copied if all their items are one of these: an immutable container (e.g. a
+# tuple) can still hold mutable values.
+_SCALAR_TYPES = frozenset([float, str, int, bool, bytes, type(None)])
+
+
+def _copy_list(value):
+    for item in value:
+        if type(item) not in _SCALAR_TYPES:
+            return deepcopy(value)
+    return list(value)
+
+
+def _copy_dict(value):
+    for item in value.values():
+        if type(item) not in _SCALAR_TYPES:
+            return deepcopy(value)
+    return dict(value)
+
+
+def _copy_set(value):
+    for item in value:
+        if type(item) not in _SCALAR_TYPES:
+            return deepcopy(value)
+    return set(value)
+
+
+def _identity(value):
+    return value
+
+
+# Cheaper alternatives to deepcopy() for common field value types.
+# Containers are only shallow copied if their contents are all scalars.
+_COPIERS = {
+    datetime.datetime: _identity,
+    datetime.date: _identity,
+    datetime.time: _identity,
+    datetime.timedelta: _identity,
+    Decimal: _identity,
+    uuid.UUID: _identity,
+    list: _copy_list,
+    dict: _copy_dict,
+    set: _copy_set,
+    bytearray: bytearray,
+}
+
+
+def _copy_value(value):
+    """
+    Returns a copy of the given value which is safe to store as an original value,
+    i.e. it won't be affected by later in-place modifications of the value.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_EXACT_TYPES:
+        return value
+    copier = _COPIERS.get(value_type)
+    if copier is not None:
+        return copier(value)
+    if isinstance(value, IMMUTABLE_TYPES_WHITELIST):
+        return value
+    return deepcopy(value)
+
+
+# The sources of the functions generated by _make_change_detector() and
+# _make_snapshotter(). Each field gets a copy of the corresponding *_FIELD_SOURCE,
+# in which:
+#  * If the value is the same object as the old value then it's unchanged.
+#    That's the common case for saves; mutable values are stored as copies, so
+#    it can only be true for (effectively) immutable ones.
+#  * For mutable types, a copy of the value is stored. Otherwise, the 'originals'
+#    list may well get modified elsewhere, and that's going to make change
+#    detection impossible.
+# Deferred fields are missing from the instance dict, so we only need to ask the
+# instance which fields are deferred if any of ours are missing. If none are (the
+# common case), the fields are handled without checking for deferred fields at all.
+_CHANGE_DETECTOR_SOURCE = """
+def detect_changes(instance, originals, offset):
+    changed_fields = {{}}
+    if instance.__dict__.keys() >= _attnames:
+{fields}
+    else:
+        deferred_fields = instance.get_deferred_fields()
+{deferrable_fields}
+    return changed_fields
+"""
+
+_CHANGE_DETECTOR_FIELD_SOURCE = """
+        new_value = {value}
+        old_value = originals[offset + {i}]
+        if new_value is not old_value:
+            {to_python}
+            if old_value != new_value:
+                new_value = _copy_value(new_value)
+                changed_fields[{name!r}] = (old_value, new_value)
+                originals[offset + {i}] = new_value
+"""
+
+_SNAPSHOTTER_SOURCE = """
+def snapshot(instance, originals, offset):
+    if instance.__dict__.keys() >= _attnames:
+{fields}
+    else:
+        deferred_fields = instance.get_deferred_fields()
+{deferrable_fields}
+"""
+
+_SNAPSHOTTER_FIELD_SOURCE = """
+        new_value = {value}
+        {to_python}
+        originals[offset + {i}] = _copy_value(new_value)
+"""
+
+_DEFERRABLE_FIELD_SOURCE = """
+        if {attname!r} not in deferred_fields:
+{field_source}
+"""
+
+
+def _generate_function(compiled, source, field_source):
+    """
+    Takes a sequence of (name, attname, value_from_object, to_python) tuples, and
+    generates a function specialised for those fields from the given source, with
+    the loop over the fields unrolled (using field_source for each field).
+
+    Returns the namespace the function was defined in.
+    """
+    namespace = {
+        "_attnames": frozenset(attname for _, attname, _, _ in compiled),
+        "_copy_value": _copy_value,
+    }
+    fields_source = []
+    deferrable_fields_source = []
+    for i, (name, attname, value_from_object, to_python) in enumerate(compiled):
+        if value_from_object is None:
+            value_source = "instance.{}".format(attname)
+        else:
+            # using value_from_object instead of getattr() means we don't traverse
+            # foreignkeys
+            namespace["_value_from_object_{}".format(i)] = value_from_object
+            value_source = "_value_from_object_{}(instance)".format(i)
+        if to_python is None:
+            to_python_source = "pass"
+        else:
+            namespace["_to_python_{}".format(i)] = to_python
+            to_python_source = "new_value = _to_python_{}(new_value)".format(i)
+        one_field_source = field_source.format(
+            i=i,
+            name=name,
+            value=value_source,
+            to_python=to_python_source,
+        )
+        fields_source.append(one_field_source)
+        deferrable_fields_source.append(
+            _DEFERRABLE_FIELD_SOURCE.format(
+                attname=attname,
+                field_source=textwrap.indent(one_field_source, "    "),
+            )
+        )
+    source = source.format(
+        fields="".join(fields_source),
+        deferrable_fields="".join(deferrable_fields_source),
+    )
+    exec(compile(source, "<fieldsignals>", "exec"), namespace)
+    return namespace
+
+
+def _make_change_detector(compiled):
+    """
+    Takes a sequence of (name, attname, value_from_object, to_python) tuples,
+    and generates a function specialised for those fields, which looks like this:
+
+        detect_changes(instance, originals, offset) -> changed_fields
+
+    where the fields' old values are in `originals` (a list) starting at `offset`.
+    They get updated with the new values.
+    """
+    namespace = _generate_function(
+        compiled, _CHANGE_DETECTOR_SOURCE, _CHANGE_DETECTOR_FIELD_SOURCE
+    )
+    return namespace["detect_changes"]
+
+
+def _make_snapshotter(compiled):
+    """
+    Takes a sequence of (name, attname, value_from_object, to_python) tuples,
+    and generates a function specialised for those fields, which looks like this:
+
+        snapshot(instance, originals, offset)
+
+    which stores the fields' current values in `originals` (a list) starting at
+    `offset`, as used by the change detector (see _make_change_detector()).
+    """
+    namespace = _generate_function(
+        compiled, _SNAPSHOTTER_SOURCE, _SNAPSHOTTER_FIELD_SOURCE
+    )
+    return namespace["snapshot"]
+
+
+# Per-sender cache of the fields returned by sender._meta.get_fields().
+# Model fields don't change once the app registry is ready, so there's no need
+# to walk the model meta again for every connect() call.
+#   {<sender>: (<tracked fields>, {<field name>: <field>})}
+_sender_fields_cache = {}
+
+# {<sender>: {<frozenset of field names>: (compiled, detect_changes, snapshot)}}
+_compiled_fields_cache = {}
+
+# Set once the app registry's models are known to be ready. It can't become
+# un-ready again, so connect() doesn't need to keep checking.
+_apps_ready = False
+
+# The number of original values stored on instances of each sender, across all
+# signals and receivers. Each receiver gets the next free offset into the
+# instance's originals when it's connected.
+# Slices aren't reused after disconnect(), since existing instances would still
+# have the disconnected receiver's values in them.
+_originals_sizes = {}
+
+# The snapshotters to run in post_init for each sender, across all signals and
+# receivers. Looks like this:
+#   {<sender>: ((<snapshot>, <originals offset>), ...)}
+_snapshotters = {}
+
+# Receivers for the model signals of senders using FieldSignalsMixin, which are
+# called directly by the mixin instead of via the model signals. Looks like this:
+#   {(<model signal>, <sender>): (<receiver>, ...)}
+_direct_receivers = {}
+
+# Reverse relations include OneToOneRel, whose many_to_many and one_to_many are
+# both False
+_REVERSE_REL_TYPES = (ForeignObjectRel,)
+
+# {<field class>: <whether it's a reverse relation class>}
+_reverse_rel_class_cache = {}
+
+
+def _is_reverse_rel(f):
+    # Check the (cheap) attributes first; most fields aren't relations at all.
+    if f.many_to_many or f.one_to_many:
+        return True
+    # many_to_many and one_to_many can be set per field, but the class check can be
+    # cached per field class.
+    field_class = type(f)
+    is_rel = _reverse_rel_class_cache.get(field_class)
+    if is_rel is None:
+        is_rel = _reverse_rel_class_cache[field_class] = issubclass(
+            field_class, _REVERSE_REL_TYPES
+        )
+    return is_rel
+
+
+def _get_to_python(f):
+    """
+    Returns the field's to_python method, or None if it's the default no-op
+    implementation from Field (in which case there's no point calling it)
+    """
+    if getattr(type(f), "to_python", None) is Field.to_python:
+        return None
+    return f.to_python
+
+
+def _get_value_from_object(f):
+    """
+    Returns the field's value_from_object method, or None if it's the default
+    implementation from Field, which just gets the attname attribute (in which case
+    the attribute can be accessed directly instead)
+    """
+    if (
+        getattr(type(f), "value_from_object", None) is Field.value_from_object
+        and f.attname.isidentifier()
+        and not keyword.iskeyword(f.attname)
+    ):
+        return None
+    return f.value_from_object
+
+
+def _get_sender_fields(sender):
+    """
+    Returns a tuple of all the fields on the given sender which can be tracked
+    (i.e. those which aren't reverse relations), and a dict mapping field names to
+    fields (including reverse relations, so they can be reported as such).
+    Both are built in a single pass over the fields.
+    """
+    result = _sender_fields_cache.get(sender)
+    if result is None:
+        tracked_fields = []
+        fields_by_name = {}
+        for f in sender._meta.get_fields():
+            # Interned, like the names in changed_fields (see _compile_fields())
+            fields_by_name[sys.intern(f.name)] = f
+            if not _is_reverse_rel(f):
+                tracked_fields.append(f)
+        result = _sender_fields_cache[sender] = (tuple(tracked_fields), fields_by_name)
+    return result
+
+
+def _compile_fields(sender, fields):
+    """
+    Returns a tuple of (name, attname, value_from_object, to_python) tuples for the
+    given fields on the sender, a change detector and a snapshotter for them
+    (see _make_change_detector() and _make_snapshotter()).
+    value_from_object and to_python may be None, if they don't need calling.
+
+    These are shared between all receivers watching the same fields on a sender.
+    """
+    sender_cache = _compiled_fields_cache.get(sender)
+    if sender_cache is None:
+        sender_cache = _compiled_fields_cache[sender] = {}
+    key = frozenset(f.name for f in fields)
+    result = sender_cache.get(key)
+    if result is None:
+        # Look up the field attributes and methods needed at save time once,
+        # instead of once per field per save.
+        # The names are interned, since they're used as keys in changed_fields, and
+        # that makes lookups in receivers (`if 'foo' in changed_fields`) cheaper.
+        compiled = tuple(
+            (
+                sys.intern(f.name),
+                sys.intern(f.attname),
+                _get_value_from_object(f),
+                _get_to_python(f),
+            )
+            for f in fields
+        )
+        result = sender_cache[key] = (
+            compiled,
+            _make_change_detector(compiled),
+            _make_snapshotter(compiled),
+        )
+    return result
+
+
+def _fieldsignals_post_init(sender, instance=None, **kwargs):
+    """
+    post_init receiver which stores the original values of the fields watched by
+    all ChangedSignal receivers for the sender. This is connected (once) for each
+    sender which has any receivers, so it's the only post_init receiver we add.
+    """
+    instance_dict = instance.__dict__
+    size = _originals_sizes[sender]
+    all_originals = instance_dict.get("_fieldsignals_originals")
+    if all_originals is None:
+        # Preallocate space for all the receivers for this sender
+        all_originals = [None] * size
+        instance_dict["_fieldsignals_originals"] = all_originals
+    elif len(all_originals) < size:
+        # Receivers have been connected since the list was created
+        all_originals.extend([None] * (size - len(all_originals)))
+    for snapshot, originals_offset in _snapshotters[sender]:
+        snapshot(instance, all_originals, originals_offset)
+
+
+def _add_snapshotter(sender, snapshot, originals_offset):
+    snapshotters = _snapshotters.get(sender)
+    if snapshotters is None:
+        snapshotters = ()
+        # FieldSignalsMixin runs the snapshotters itself
+        if not issubclass(sender, FieldSignalsMixin):
+            _signals.post_init.connect(
+                _fieldsignals_post_init, sender=sender, dispatch_uid="fieldsignals"
+            )
+    _snapshotters[sender] = snapshotters + ((snapshot, originals_offset),)
+
+
+def _remove_snapshotter(sender, originals_offset):
+    # Offsets are unique per sender, so they identify the snapshotter to remove
+    _snapshotters[sender] = tuple(
+        s for s in _snapshotters[sender] if s[1] != originals_offset
+    )
+
+
+def _connect_source_signal(signal, receiver, sender, dispatch_uid):
+    """
+    Connects a receiver to a model signal (pre_save or post_save) for the sender.
+    For senders using FieldSignalsMixin, the receiver is called directly by the
+    mixin instead, so it's registered in _direct_receivers.
+    """
+    if issubclass(sender, FieldSignalsMixin):
+        key = (signal, sender)
+        _direct_receivers[key] = _direct_receivers.get(key, ()) + (receiver,)
+    else:
+        signal.connect(receiver, sender=sender, dispatch_uid=dispatch_uid)
+
+
+class FieldSignalsMixin(object):
+    """
+    An optional mixin for models, which runs the fieldsignals machinery directly
+    from __init__() and save_base(), rather than via Django's post_init, pre_save
+    and post_save signals. Usage::
+
+        class Poll(FieldSignalsMixin, models.Model):
+            ...
+
+    Receivers are connected to pre_save_changed and post_save_changed as usual.
+    pre_save_changed receivers are called before any pre_save receivers, and
+    post_save_changed receivers after any post_save receivers.
+
+    Relies on Model._save_table() (which is private) returning whether the save
+    updated an existing row.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(FieldSignalsMixin, self).__init__(*args, **kwargs)
+        sender = type(self)
+        if sender in _snapshotters:
+            _fieldsignals_post_init(sender, instance=self)
+
+    def save_base(self, *args, **kwargs):
+        sender = type(self)
+        for receiver in _direct_receivers.get((_signals.pre_save, sender), ()):
+            receiver(sender, instance=self)
+        super(FieldSignalsMixin, self).save_base(*args, **kwargs)
+        # Set by _save_table(), like `created` for the post_save signal
+        created = self.__dict__.pop("_fieldsignals_created", None)
+        for receiver in _direct_receivers.get((_signals.post_save, sender), ()):
+            receiver(sender, instance=self, created=created, using=self._state.db)
+
+    def _save_table(self, *args, **kwargs):
+        updated = super(FieldSignalsMixin, self)._save_table(*args, **kwargs)
+        # save_base() saves any parent tables first, so the last call is for the
+        # model's own table, which is what Model.save_base() bases `created` on.
+        self.__dict__["_fieldsignals_created"] = not updated
+        return updated
+
+
+class _ProxyReceiver(object):
+    # Wraps a receiver for a ChangedSignal; see ChangedSignal._make_proxy_receiver().
+    # Uses __slots__ for fast attribute access, since it's called on every save.
+    # (It can't have a docstring, since __doc__ is a slot copied from the receiver)
+    __slots__ = (
+        "signal",
+        "originals_offset",
+        "originals_size",
+        "detect_changes",
+        "_original_receiver",
+        "_fields",
+        "__doc__",
+        "__name__",
+    )
+
+    def __init__(
+        self,
+        signal,
+        receiver,
+        fields,
+        compiled,
+        originals_offset,
+        detect_changes,
+    ):
+        self.signal = signal
+        self.originals_offset = originals_offset
+        self.originals_size = len(compiled)
+        self.detect_changes = detect_changes
+        self._original_receiver = receiver
+        self._fields = fields
+        self.__doc__ = receiver.__doc__
+        # Receivers can be any callable, which won't necessarily have a __name__
+        self.__name__ = getattr(receiver, "__name__", type(receiver).__name__)
+
+    def __call__(self, instance, signal=None, sender=None, **kwargs):
+        changed_fields = self.signal._get_and_update_changed_fields(
+            instance, self.originals_offset, self.originals_size, self.detect_changes
+        )
+        if changed_fields:
+            self._original_receiver(
+                signal=signal,
+                sender=sender,
+                instance=instance,
+                changed_fields=changed_fields,
+                **kwargs,
+            )
+
 
 class ChangedSignal(Signal):
     """
@@ -19,6 +504,18 @@ class ChangedSignal(Signal):
     The given receiver is only called when one or more of the given fields has changed.
     """
 
+    def __init__(self, *args, **kwargs):
+        super(ChangedSignal, self).__init__(*args, **kwargs)
+        # Senders which the source signals have been connected for
+        self._wired_senders = set()
+        # The proxy receivers connected via connect(), so they can be called directly
+        # rather than going through Signal.send(). Looks like this:
+        #   {<sender>: (<proxy receiver>, ...)}
+        self._fast_receivers = {}
+        # Looks like this:
+        #   {(<dispatch_uid or receiver id>, <sender id>): <proxy receiver>}
+        self._fast_receiver_keys = {}
+
     def connect(self, receiver, sender=None, fields=None, dispatch_uid=None, **kwargs):
         """
         Connect a FieldSignal. Usage::
@@ -26,13 +523,17 @@ class ChangedSignal(Signal):
             foo.connect(func, sender=MyModel, fields=['myfield1', 'myfield2'])
         """
 
-        if not apps.models_ready:
-            # We require access to Model._meta.get_fields(), which isn't available yet.
-            # (This error would be raised below anyway, but we want to add a more meaningful message)
-            raise AppRegistryNotReady(
-                "django-fieldsignals signals must be connected after the app cache is ready. "
-                "Connect the signal in your AppConfig.ready() handler."
-            )
+        global _apps_ready
+        if not _apps_ready:
+            if not apps.models_ready:
+                # We require access to Model._meta.get_fields(), which isn't available
+                # yet. (This error would be raised below anyway, but we want to add a
+                # more meaningful message)
+                raise AppRegistryNotReady(
+                    "django-fieldsignals signals must be connected after the app cache is ready. "
+                    "Connect the signal in your AppConfig.ready() handler."
+                )
+            _apps_ready = True
 
         # Validate arguments
 
@@ -48,123 +549,203 @@ class ChangedSignal(Signal):
         if not isinstance(sender, type):
             raise ValueError("sender should be a model class")
 
-        def is_reverse_rel(f):
-            return f.many_to_many or f.one_to_many or isinstance(f, ForeignObjectRel)
-
+        tracked_fields, fields_by_name = _get_sender_fields(sender)
         if fields is None:
-            fields = sender._meta.get_fields()
-            fields = [f for f in fields if not is_reverse_rel(f)]
+            fields = tracked_fields
         else:
-            fields = [f for f in sender._meta.get_fields() if f.name in set(fields)]
-            for f in fields:
-                if is_reverse_rel(f):
+            field_names = fields
+            fields = []
+            # Ignore duplicate names (but keep the order)
+            for name in dict.fromkeys(field_names):
+                f = fields_by_name.get(name)
+                if f is None:
+                    raise ValueError(
+                        "{sender.__name__} has no field named {name!r}".format(
+                            sender=sender, name=name
+                        )
+                    )
+                if _is_reverse_rel(f):
                     raise ValueError(
                         "django-fieldsignals doesn't handle reverse related fields "
                         "({f.name} is a {f.__class__.__name__})".format(f=f)
                     )
+                fields.append(f)
 
         if not fields:
             raise ValueError("fields must be non-empty")
 
-        proxy_receiver = self._make_proxy_receiver(receiver, sender, fields)
+        # Like Signal.connect(), ignore receivers which are already connected.
+        lookup_key = (dispatch_uid or _make_id(receiver), _make_id(sender))
+        connected_proxy = self._fast_receiver_keys.get(lookup_key)
+        if connected_proxy is not None:
+            # ... unless they'd be watching different fields, which we can't ignore
+            if frozenset(f.name for f in fields) != frozenset(
+                f.name for f in connected_proxy._fields
+            ):
+                raise ValueError(
+                    "{receiver!r} is already connected for {sender.__name__} with "
+                    "different fields".format(receiver=receiver, sender=sender)
+                )
+            return
+
+        if dispatch_uid is not None and any(r[0] == lookup_key for r in self.receivers):
+            # Something else was connected with the same dispatch_uid (e.g. via
+            # Signal.connect()), so Signal.connect() would ignore our proxy receiver.
+            # That receiver still needs the source signals though.
+            self._connect_source_signals_once(sender)
+            return
+
+        compiled, detect_changes, snapshot = _compile_fields(sender, fields)
+
+        # Each connected receiver stores its original field values in its own slice
+        # of the instance's list of originals.
+        originals_offset = _originals_sizes.get(sender, 0)
+        _originals_sizes[sender] = originals_offset + len(compiled)
+
+        proxy_receiver = self._make_proxy_receiver(
+            receiver,
+            sender,
+            fields,
+            compiled,
+            originals_offset,
+            detect_changes,
+        )
 
         super(ChangedSignal, self).connect(
             proxy_receiver, sender=sender, weak=False, dispatch_uid=dispatch_uid
         )
+        self._fast_receiver_keys[lookup_key] = proxy_receiver
+        self._fast_receivers[sender] = self._fast_receivers.get(sender, ()) + (
+            proxy_receiver,
+        )
 
         ### post_init : initialize the list of fields for each instance
-        def post_init_closure(sender, instance, **kwargs):
-            self.get_and_update_changed_fields(receiver, instance, fields)
+        _add_snapshotter(sender, snapshot, originals_offset)
 
-        _signals.post_init.connect(
-            post_init_closure, sender=sender, weak=False, dispatch_uid=(self, receiver)
+        self._connect_source_signals_once(sender)
+
+    def disconnect(self, receiver=None, sender=None, dispatch_uid=None):
+        """
+        Disconnect a receiver, given the same receiver (or dispatch_uid) and sender as
+        were passed to connect().
+        """
+        lookup_key = (dispatch_uid or _make_id(receiver), _make_id(sender))
+        proxy_receiver = self._fast_receiver_keys.pop(lookup_key, None)
+        if proxy_receiver is None:
+            # Not connected via connect(), or not connected at all
+            return super(ChangedSignal, self).disconnect(
+                receiver, sender=sender, dispatch_uid=dispatch_uid
+            )
+        self._fast_receivers[sender] = tuple(
+            r for r in self._fast_receivers[sender] if r is not proxy_receiver
         )
-        self.connect_source_signals(sender)
+        _remove_snapshotter(sender, proxy_receiver.originals_offset)
+        return super(ChangedSignal, self).disconnect(
+            proxy_receiver, sender=sender, dispatch_uid=dispatch_uid
+        )
+
+    def _can_send_fast(self):
+        """
+        Returns True if our proxy receivers are the only receivers for this signal,
+        so they can be called directly instead of via Signal.send().
+        This won't be the case if a receiver was connected some other way, e.g. via
+        Signal.connect().
+
+        As with Signal.send(), exceptions raised by receivers aren't caught when
+        they're called directly, so a pre_save receiver can still abort a save.
+        """
+        receivers = self.receivers
+        if len(receivers) != len(self._fast_receiver_keys):
+            return False
+        # Our proxy receivers are only ever connected by connect(), which records
+        # them, and disconnect() removes them from both. So if all the receivers are
+        # our proxies, they're exactly the ones we know about.
+        for r in receivers:
+            if type(r[1]) is not _ProxyReceiver:
+                return False
+        return True
+
+    def _connect_source_signals_once(self, sender):
+        if sender not in self._wired_senders:
+            self._wired_senders.add(sender)
+            self.connect_source_signals(sender)
 
     def connect_source_signals(self, sender):
         """
         Connects the source signals required to trigger updates for this
-        ChangedSignal.
+        ChangedSignal. Called once per sender.
 
-        (post_init has already been connected during __init__)
+        (post_init is handled by _fieldsignals_post_init(), for all signals)
         """
         # override in subclasses
         pass
 
-    def _make_proxy_receiver(self, receiver, sender, fields):
+    def _make_proxy_receiver(
+        self,
+        receiver,
+        sender,
+        fields,
+        compiled,
+        originals_offset,
+        detect_changes,
+    ):
         """
-        Takes a receiver function and creates a closure around it that knows what fields
-        to watch. The original receiver is called for an instance iff the value of
-        at least one of the fields has changed since the last time it was called.
+        Takes a receiver function and creates a callable wrapping it that knows what
+        fields to watch. The original receiver is called for an instance iff the value
+        of at least one of the fields has changed since the last time it was called.
         """
+        return _ProxyReceiver(
+            self, receiver, fields, compiled, originals_offset, detect_changes
+        )
 
-        def pr(instance, *args, **kwargs):
-            changed_fields = self.get_and_update_changed_fields(
-                receiver, instance, fields
-            )
-            if changed_fields:
-                receiver(
-                    instance=instance, changed_fields=changed_fields, *args, **kwargs
-                )
-
-        pr._original_receiver = receiver
-        pr._fields = fields
-
-        pr.__doc__ = receiver.__doc__
-        pr.__name__ = receiver.__name__
-        return pr
-
-    def get_and_update_changed_fields(self, receiver, instance, fields):
+    def _get_and_update_changed_fields(
+        self, instance, originals_offset, originals_size, detect_changes
+    ):
         """
-        Takes a receiver and a model instance, and a list of field instances.
-        Gets the old and new values for each of the given fields, and stores their
-        new values for next time.
+        Takes a model instance, the offset and size of a receiver's slice of the
+        instance's originals, and the change detector for the receiver's fields
+        (see _make_change_detector()).
+        Gets the old and new values for each of the fields, and stores their
+        new values (converted by to_python()) for next time.
 
         Returns a dict like this:
             {
                 "fieldname1" : ("old value", "new value"),
             }
         """
-        # instance._fieldsignals_originals looks like this:
-        #   {
-        #       (id(<signal instance>), id(<receiver>)) : {"field_name": "old value",},
-        #   }
-        key = (id(self), id(receiver))
-        if not hasattr(instance, "_fieldsignals_originals"):
-            instance._fieldsignals_originals = {}
-        if key not in instance._fieldsignals_originals:
-            instance._fieldsignals_originals[key] = {}
-        originals = instance._fieldsignals_originals[key]
-        changed_fields = {}
-
-        deferred_fields = instance.get_deferred_fields()
-
-        for field in fields:
-            if field.attname in deferred_fields:
-                continue
-            # using value_from_object instead of getattr() means we don't traverse foreignkeys
-            new_value = field.to_python(field.value_from_object(instance))
-            old_value = originals.get(field.name, None)
-            if old_value != new_value:
-                if not isinstance(new_value, IMMUTABLE_TYPES_WHITELIST):
-                    # For mutable types, make a copy of the value before storing it.
-                    # Otherwise, the 'originals' dict may well get modified elsewhere, and
-                    # that's going to make change detection impossible
-                    new_value = deepcopy(new_value)
-
-                changed_fields[field.name] = (old_value, new_value)
-                # now update, for next time
-                originals[field.name] = new_value
-        return changed_fields
+        # instance._fieldsignals_originals is a flat list of the old values of all
+        # the fields watched by all receivers for the instance's class. Each receiver
+        # has its own slice of it, in the same order as its compiled fields:
+        #   [<receiver 0 field 0>, <receiver 0 field 1>, <receiver 1 field 0>, ...]
+        # The old values have already been through to_python(), so only the new
+        # values ever need converting.
+        # It's stored on the instance rather than in a WeakKeyDictionary keyed by
+        # instance, because model instances without a pk are unhashable (and the pk
+        # changes when they're saved). It's a single list, so it only costs one
+        # entry in the instance dict however many fields are watched.
+        # Access the instance dict directly rather than going through
+        # getattr()/hasattr() and the model's descriptors.
+        instance_dict = instance.__dict__
+        originals = instance_dict.get("_fieldsignals_originals")
+        if originals is None:
+            instance_dict["_fieldsignals_originals"] = originals = []
+        size = originals_offset + originals_size
+        if len(originals) < size:
+            # The receiver was connected after the instance was created
+            originals.extend([None] * (size - len(originals)))
+        return detect_changes(instance, originals, originals_offset)
 
 
 class PreSaveChangedSignal(ChangedSignal):
     def _on_model_pre_save(self, sender, instance=None, **kwargs):
-        return self.send(sender, instance=instance)
+        if not self._can_send_fast():
+            return self.send(sender, instance=instance)
+        for proxy_receiver in self._fast_receivers.get(sender, ()):
+            proxy_receiver(instance, signal=self, sender=sender)
 
     def connect_source_signals(self, sender):
-        _signals.pre_save.connect(
-            self._on_model_pre_save, sender=sender, dispatch_uid=id(self)
+        _connect_source_signal(
+            _signals.pre_save, self._on_model_pre_save, sender, dispatch_uid=id(self)
         )
 
 
@@ -172,11 +753,16 @@ class PostSaveChangedSignal(ChangedSignal):
     def _on_model_post_save(
         self, sender, instance=None, created=None, using=None, **kwargs
     ):
-        return self.send(sender, instance=instance, created=created, using=using)
+        if not self._can_send_fast():
+            return self.send(sender, instance=instance, created=created, using=using)
+        for proxy_receiver in self._fast_receivers.get(sender, ()):
+            proxy_receiver(
+                instance, signal=self, sender=sender, created=created, using=using
+            )
 
     def connect_source_signals(self, sender):
-        _signals.post_save.connect(
-            self._on_model_post_save, sender=sender, dispatch_uid=id(self)
+        _connect_source_signal(
+            _signals.post_save, self._on_model_post_save, sender, dispatch_uid=id(self)
         )
 
 
@@ -1,2 +0,0 @@
-import os
-from .test_signals import *
@@ -1,39 +1,51 @@
 import datetime
-from contextlib import contextmanager
+from copy import deepcopy
 from collections import namedtuple
 
 import pytest
 
 from django.apps import apps
 from django.core.exceptions import AppRegistryNotReady
+from django.db import models
 from django.db.models.fields.related import OneToOneRel
 from django.db.models.signals import post_save, post_init, pre_save
+from django.dispatch import Signal
+from django.dispatch.dispatcher import _make_id
 from django.utils.dateparse import parse_datetime
 from django.utils.timezone import utc
 
+from fieldsignals import signals
 from fieldsignals.signals import post_save_changed, pre_save_changed
 
 _field = namedtuple("field", ["name"])
 
 
-@contextmanager
-def must_be_called(must=True):
-    x = {"called": False}
+class must_be_called(object):
+    """
+    A receiver which asserts that it was (or wasn't) called by the end of the block.
+    """
 
-    def func(*args, **kwargs):
-        x["called"] = True
-        func.args = args
-        func.kwargs = kwargs
+    def __init__(self, must=True):
+        self.must = must
+        self.called = False
+        self.args = None
+        self.kwargs = None
 
-    func.args = None
-    func.kwargs = None
+    def __call__(self, *args, **kwargs):
+        self.called = True
+        self.args = args
+        self.kwargs = kwargs
 
-    yield func
+    def __enter__(self):
+        return self
 
-    if x["called"] and not must:
-        raise AssertionError("Function was called, shouldn't have been")
-    elif must and not x["called"]:
-        raise AssertionError("Function wasn't called, should have been")
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            return False
+        if self.called and not self.must:
+            raise AssertionError("Function was called, shouldn't have been")
+        elif self.must and not self.called:
+            raise AssertionError("Function wasn't called, should have been")
 
 
 class Called(Exception):
@@ -45,6 +57,8 @@ def func(*args, **kwargs):
 
 
 class Field(object):
+    __slots__ = ("name", "attname", "many_to_many", "one_to_many")
+
     def __init__(self, name, m2m=False):
         self.name = name
         self.attname = name
@@ -59,6 +73,8 @@ class Field(object):
 
 
 class DateTimeField(Field):
+    __slots__ = ()
+
     def to_python(self, value):
         # approximate a datetime field
         if value is None:
@@ -69,6 +85,14 @@ class DateTimeField(Field):
         return parse_datetime(value)
 
 
+_FIELDS = [
+    Field("a_key"),
+    Field("another"),
+    Field("m2m", m2m=True),
+    DateTimeField("a_datetime"),
+]
+
+
 class FakeModel(object):
     a_key = "a value"
     another = "something else"
@@ -78,30 +102,67 @@ class FakeModel(object):
     class _meta(object):
         @staticmethod
         def get_fields():
-            return [
-                Field("a_key"),
-                Field("another"),
-                Field("m2m", m2m=True),
-                DateTimeField("a_datetime"),
-            ]
+            return _FIELDS
 
     def get_deferred_fields(self):
         return set()
 
 
+_DEFERRED_MODEL_FIELDS = [
+    Field("a"),
+    Field("b"),
+]
+
+
 class DeferredModel(object):
     a = 1
 
+    class _meta(object):
+        @staticmethod
+        def get_fields():
+            return _DEFERRED_MODEL_FIELDS
+
+    def get_deferred_fields(self):
+        return {"b"}
+
+
+class LoadedModel(object):
+    class _meta(object):
+        @staticmethod
+        def get_fields():
+            return [Field("a")]
+
+    def __init__(self):
+        self.a = 1
+
+    def get_deferred_fields(self):
+        raise AssertionError("get_deferred_fields() shouldn't be called")
+
+
+def django_field(field_class, name):
+    field = field_class()
+    field.set_attributes_from_name(name)
+    return field
+
+
+class DjangoFieldsModel(object):
+    """
+    Uses real django fields, which use the default Field.value_from_object()
+    """
+
+    a = 1
+    b = "b"
+
     class _meta(object):
         @staticmethod
         def get_fields():
             return [
-                Field("a"),
-                Field("b"),
+                django_field(models.IntegerField, "a"),
+                django_field(models.Field, "b"),
             ]
 
     def get_deferred_fields(self):
-        return {"b"}
+        return set()
 
 
 class MockOneToOneRel(OneToOneRel):
@@ -111,6 +172,9 @@ class MockOneToOneRel(OneToOneRel):
         self.one_to_many = False
 
 
+_ONE_TO_ONE_MODEL_FIELDS = [Field("f"), MockOneToOneRel("o2o")]
+
+
 class FakeModelWithOneToOne(object):
     f = "a value"
     o2o = 1
@@ -118,7 +182,35 @@ class FakeModelWithOneToOne(object):
     class _meta(object):
         @staticmethod
         def get_fields():
-            return [Field("f"), MockOneToOneRel("o2o")]
+            return _ONE_TO_ONE_MODEL_FIELDS
+
+
+class FakeState(object):
+    adding = True
+    db = None
+
+
+class SavingModel(FakeModel):
+    """
+    Saves like a django model, as far as FieldSignalsMixin is concerned
+    """
+
+    # pks of the rows in the fake table
+    existing_pks = {1}
+
+    def __init__(self, pk=None):
+        self.pk = pk
+        self._state = FakeState()
+
+    def save_base(self, using="default"):
+        pre_save.send(sender=type(self), instance=self)
+        self._save_table(using=using)
+        self._state.adding = False
+        self._state.db = using
+
+    def _save_table(self, using=None):
+        # Like django, this updates the existing row if there is one
+        return self.pk in self.existing_pks
 
 
 class TestGeneral(object):
@@ -131,6 +223,13 @@ class TestGeneral(object):
             with pytest.raises(ValueError):
                 post_save_changed.connect(func, sender=FakeModel, fields=("m2m",))
 
+    def test_unknown_field_error(self):
+        with must_be_called(False) as func:
+            with pytest.raises(ValueError):
+                post_save_changed.connect(
+                    func, sender=FakeModel, fields=("a_key", "not_a_field")
+                )
+
     def test_one_to_one_rel_field_error(self):
         with must_be_called(False) as func:
             with pytest.raises(ValueError):
@@ -142,8 +241,9 @@ class TestGeneral(object):
         with must_be_called(False) as func:
             post_save_changed.connect(func, sender=FakeModelWithOneToOne)
 
-    def test_app_cache_not_ready(self):
+    def test_app_cache_not_ready(self, monkeypatch):
         apps.models_ready = False
+        monkeypatch.setattr(signals, "_apps_ready", False)
         with pytest.raises(AppRegistryNotReady):
             post_save_changed.connect(func, sender=FakeModel)
 
@@ -164,113 +264,487 @@ class TestGeneral(object):
             obj.a_datetime = datetime.datetime(2017, 1, 1, 0, 0, 0, 0, utc)
             pre_save.send(instance=obj, sender=FakeModel)
 
-    def test_deferred_fields(self):
-        pre_save_changed.connect(func, sender=DeferredModel)
+    def test_to_python_none(self):
+        """
+        None is converted by to_python() when the originals are stored, just like
+        when they're compared.
+        """
 
-        obj = DeferredModel()
-        post_init.send(instance=obj, sender=DeferredModel)
+        class EmptyStringField(Field):
+            __slots__ = ()
 
-        assert list(obj._fieldsignals_originals.values()) == [{"a": 1}]
+            def to_python(self, value):
+                return "" if value is None else value
 
+        class EmptyStringModel(object):
+            a = None
 
-class TestPostSave(object):
-    @pytest.fixture(autouse=True)
-    def ready(self):
-        apps.models_ready = True
+            class _meta(object):
+                @staticmethod
+                def get_fields():
+                    return [EmptyStringField("a")]
+
+            def get_deferred_fields(self):
+                return set()
+
+        with must_be_called(True) as func:
+            pre_save_changed.connect(func, sender=EmptyStringModel)
+
+            obj = EmptyStringModel()
+            post_init.send(instance=obj, sender=EmptyStringModel)
+            assert obj._fieldsignals_originals == [""]
+
+            obj.a = "x"
+            pre_save.send(instance=obj, sender=EmptyStringModel)
+        assert func.kwargs["changed_fields"] == {"a": ("", "x")}
+
+    def test_post_init_again_stores_none(self):
+        class ResnapshotModel(FakeModel):
+            pass
 
-    def test_post_save_unchanged(self):
         with must_be_called(False) as func:
-            post_save_changed.connect(func, sender=FakeModel)
+            pre_save_changed.connect(func, sender=ResnapshotModel, fields=("a_key",))
+
+            obj = ResnapshotModel()
+            post_init.send(instance=obj, sender=ResnapshotModel)
+            obj.a_key = None
+            post_init.send(instance=obj, sender=ResnapshotModel)
+
+            pre_save.send(instance=obj, sender=ResnapshotModel)
+
+    def test_originals_stored_after_to_python(self):
+        """
+        Original values are stored after conversion by to_python(), so they don't
+        need converting again when compared.
+        """
+        with must_be_called(True) as func:
+            pre_save_changed.connect(func, sender=FakeModel, fields=("a_datetime",))
 
             obj = FakeModel()
+            obj.a_datetime = "2017-01-01T00:00:00.000000Z"
             post_init.send(instance=obj, sender=FakeModel)
-            # This *doesn't* call post_save_changed, because we haven't changed anything.
-            post_save.send(instance=obj, sender=FakeModel)
 
-    def test_post_save_changed(self):
+            obj.a_datetime = "2018-01-01T00:00:00.000000Z"
+            pre_save.send(instance=obj, sender=FakeModel)
+        assert func.kwargs["changed_fields"] == {
+            "a_datetime": (
+                datetime.datetime(2017, 1, 1, 0, 0, 0, 0, utc),
+                datetime.datetime(2018, 1, 1, 0, 0, 0, 0, utc),
+            )
+        }
+
+    @pytest.mark.parametrize(
+        "value, modify",
+        [
+            ([1, 2], lambda value: value.append(3)),
+            ({"a": 1}, lambda value: value.update(b=2)),
+            ({"a": [1, 2]}, lambda value: value["a"].append(3)),
+            ([{"a": 1}], lambda value: value[0].update(b=2)),
+            ([(1, [2])], lambda value: value[0][1].append(3)),
+            ({"a": (1, [2])}, lambda value: value["a"][1].append(3)),
+        ],
+    )
+    def test_mutable_value_modified_in_place(self, value, modify):
+        """
+        Mutable values are copied before being stored, so in-place changes are noticed.
+        """
         with must_be_called(True) as func:
-            post_save_changed.connect(func, sender=FakeModel)
+            pre_save_changed.connect(func, sender=FakeModel, fields=("a_key",))
 
             obj = FakeModel()
+            obj.a_key = value
             post_init.send(instance=obj, sender=FakeModel)
+            old_value = deepcopy(value)
+
+            modify(obj.a_key)
+            pre_save.send(instance=obj, sender=FakeModel)
+        assert func.kwargs["changed_fields"] == {"a_key": (old_value, value)}
 
+    def test_disconnect_with_dispatch_uid(self):
+        with must_be_called(False) as func:
+            pre_save_changed.connect(
+                func, sender=FakeModel, dispatch_uid="test_disconnect"
+            )
+            assert pre_save_changed.disconnect(
+                sender=FakeModel, dispatch_uid="test_disconnect"
+            )
+
+            obj = FakeModel()
+            post_init.send(instance=obj, sender=FakeModel)
             obj.a_key = "another value"
-            post_save.send(instance=obj, sender=FakeModel)
-        assert func.kwargs["changed_fields"] == {"a_key": ("a value", "another value")}
+            pre_save.send(instance=obj, sender=FakeModel)
+
+    @pytest.mark.parametrize(
+        "signal, source_signal",
+        [(pre_save_changed, pre_save), (post_save_changed, post_save)],
+    )
+    def test_receiver_exception_propagates(self, signal, source_signal):
+        """
+        Exceptions raised by receivers aren't swallowed, same as for Signal.send()
+        """
+        signal.connect(func, sender=FakeModel, dispatch_uid="test_exception")
+        try:
+            obj = FakeModel()
+            post_init.send(instance=obj, sender=FakeModel)
+            obj.a_key = "another value"
+            with pytest.raises(Called):
+                source_signal.send(instance=obj, sender=FakeModel)
+        finally:
+            signal.disconnect(sender=FakeModel, dispatch_uid="test_exception")
+
+    def test_plain_receiver_with_same_dispatch_uid(self):
+        class SameUidModel(FakeModel):
+            pass
+
+        with must_be_called(True) as plain, must_be_called(False) as func:
+            # Connect a plain receiver, then try to connect one with the same uid.
+            # Signal.connect() ignores the second one, so we do too.
+            Signal.connect(
+                pre_save_changed, plain, sender=SameUidModel, dispatch_uid="u"
+            )
+            pre_save_changed.connect(func, sender=SameUidModel, dispatch_uid="u")
+
+            obj = SameUidModel()
+            post_init.send(instance=obj, sender=SameUidModel)
+            pre_save.send(instance=obj, sender=SameUidModel)
+        Signal.disconnect(pre_save_changed, sender=SameUidModel, dispatch_uid="u")
+
+    def test_post_init_after_late_connect(self):
+        class LateConnectModel(FakeModel):
+            pass
 
-    def test_post_save_with_fields_changed(self):
         with must_be_called(True) as func:
-            post_save_changed.connect(func, sender=FakeModel, fields=("a_key",))
+            pre_save_changed.connect(func, sender=LateConnectModel, fields=("a_key",))
+            obj = LateConnectModel()
+            post_init.send(instance=obj, sender=LateConnectModel)
+
+            # Connected after obj's originals were created
+            post_save_changed.connect(func, sender=LateConnectModel)
+            post_init.send(instance=obj, sender=LateConnectModel)
+            assert len(obj._fieldsignals_originals) == 4
+
+            obj.a_key = "another value"
+            post_save.send(instance=obj, sender=LateConnectModel)
+        assert func.kwargs["changed_fields"] == {"a_key": ("a value", "another value")}
+
+    def test_reconnect_after_disconnect(self):
+        """
+        A receiver connected after another was disconnected doesn't see the
+        disconnected receiver's original values.
+        """
+
+        class ReconnectModel(FakeModel):
+            pass
+
+        with must_be_called(True) as func_a:
+            pre_save_changed.connect(func_a, sender=ReconnectModel, fields=("a_key",))
+            obj = ReconnectModel()
+            post_init.send(instance=obj, sender=ReconnectModel)
+            obj.a_key = "another value"
+            pre_save.send(instance=obj, sender=ReconnectModel)
+            pre_save_changed.disconnect(func_a, sender=ReconnectModel)
+
+        with must_be_called(True) as func_b:
+            pre_save_changed.connect(func_b, sender=ReconnectModel, fields=("a_key",))
+            pre_save.send(instance=obj, sender=ReconnectModel)
+        assert func_b.kwargs["changed_fields"] == {"a_key": (None, "another value")}
 
+    def test_connect_twice(self):
+        calls = []
+
+        def receiver(**kwargs):
+            calls.append(kwargs)
+
+        pre_save_changed.connect(receiver, sender=FakeModel)
+        pre_save_changed.connect(receiver, sender=FakeModel)
+        try:
             obj = FakeModel()
             post_init.send(instance=obj, sender=FakeModel)
+            obj.a_key = "another value"
+            pre_save.send(instance=obj, sender=FakeModel)
+            assert len(calls) == 1
+        finally:
+            assert pre_save_changed.disconnect(receiver, sender=FakeModel)
+        assert not pre_save_changed.disconnect(receiver, sender=FakeModel)
+
+    def test_connect_twice_with_different_fields(self):
+        class TwiceModel(FakeModel):
+            pass
+
+        pre_save_changed.connect(func, sender=TwiceModel, fields=("a_key",))
+        pre_save_changed.connect(func, sender=TwiceModel, fields=["a_key"])
+        with pytest.raises(ValueError):
+            pre_save_changed.connect(func, sender=TwiceModel, fields=("another",))
+        with pytest.raises(ValueError):
+            pre_save_changed.connect(func, sender=TwiceModel, fields=("not_a_field",))
+
+    def test_plain_receiver(self):
+        """
+        Receivers connected via Signal.connect() are still called.
+        """
+        with must_be_called(True) as plain_func:
+            Signal.connect(pre_save_changed, plain_func, sender=FakeModel, weak=False)
+            try:
+                with must_be_called(True) as func:
+                    pre_save_changed.connect(func, sender=FakeModel)
+
+                    obj = FakeModel()
+                    post_init.send(instance=obj, sender=FakeModel)
+                    obj.a_key = "another value"
+                    pre_save.send(instance=obj, sender=FakeModel)
+            finally:
+                Signal.disconnect(pre_save_changed, plain_func, sender=FakeModel)
+        assert plain_func.kwargs["instance"] is obj
+
+    def test_django_fields(self):
+        with must_be_called(True) as func:
+            pre_save_changed.connect(func, sender=DjangoFieldsModel)
 
-            obj.a_key = "change a field that we care about"
-            post_save.send(instance=obj, sender=FakeModel)
-        assert func.kwargs["changed_fields"] == {
-            "a_key": ("a value", "change a field that we care about")
-        }
+            obj = DjangoFieldsModel()
+            post_init.send(instance=obj, sender=DjangoFieldsModel)
+
+            # Not a change, once converted by IntegerField.to_python()
+            obj.a = "1"
+            obj.b = "c"
+            pre_save.send(instance=obj, sender=DjangoFieldsModel)
+        assert func.kwargs["changed_fields"] == {"b": ("b", "c")}
+
+    def test_to_python_not_called_for_unchanged_values(self):
+        """
+        If a value is identical to the original value, it's not converted again.
+        """
+        to_python_calls = []
+
+        class CountingField(Field):
+            def to_python(self, value):
+                to_python_calls.append(value)
+                return value
+
+        class CountingModel(object):
+            a = "a value"
+
+            class _meta(object):
+                @staticmethod
+                def get_fields():
+                    return [CountingField("a")]
+
+            def get_deferred_fields(self):
+                return set()
 
-    def test_post_save_with_fields_unchanged(self):
         with must_be_called(False) as func:
-            post_save_changed.connect(func, sender=FakeModel, fields=("a_key",))
+            pre_save_changed.connect(func, sender=CountingModel)
 
-            obj = FakeModel()
-            post_init.send(instance=obj, sender=FakeModel)
+            obj = CountingModel()
+            post_init.send(instance=obj, sender=CountingModel)
+            assert to_python_calls == ["a value"]
 
-            obj.another = "dont care about this field"
-            post_save.send(instance=obj, sender=FakeModel)
+            pre_save.send(instance=obj, sender=CountingModel)
+            assert to_python_calls == ["a value"]
 
+    def test_deferred_fields(self):
+        pre_save_changed.connect(func, sender=DeferredModel)
+
+        obj = DeferredModel()
+        post_init.send(instance=obj, sender=DeferredModel)
+
+        # b is deferred, so it hasn't been recorded
+        assert obj._fieldsignals_originals == [1, None]
 
-class TestPreSave(object):
+    def test_deferred_fields_not_checked_if_all_loaded(self):
+        with must_be_called(True) as func:
+            pre_save_changed.connect(func, sender=LoadedModel)
+
+            obj = LoadedModel()
+            post_init.send(instance=obj, sender=LoadedModel)
+
+            obj.a = 2
+            pre_save.send(instance=obj, sender=LoadedModel)
+        assert func.kwargs["changed_fields"] == {"a": (1, 2)}
+
+    def test_one_post_init_receiver_per_sender(self):
+        class OnePostInitModel(FakeModel):
+            pass
+
+        with must_be_called(True) as pre_func, must_be_called(True) as post_func:
+            pre_save_changed.connect(pre_func, sender=OnePostInitModel)
+            post_save_changed.connect(
+                post_func, sender=OnePostInitModel, fields=("a_key",)
+            )
+            sender_id = _make_id(OnePostInitModel)
+            lookup_keys = [r[0] for r in post_init.receivers]
+            assert [k for k in lookup_keys if k[1] == sender_id] == [
+                ("fieldsignals", sender_id)
+            ]
+
+            obj = OnePostInitModel()
+            post_init.send(instance=obj, sender=OnePostInitModel)
+
+            obj.a_key = "another value"
+            pre_save.send(instance=obj, sender=OnePostInitModel)
+            post_save.send(instance=obj, sender=OnePostInitModel)
+        assert pre_func.kwargs["changed_fields"] == {
+            "a_key": ("a value", "another value")
+        }
+        assert post_func.kwargs["changed_fields"] == {
+            "a_key": ("a value", "another value")
+        }
+
+    def test_unhashable_instance(self):
+        class UnhashableModel(FakeModel):
+            # Like django model instances without a pk
+            __hash__ = None
+
+        with must_be_called(True) as func:
+            pre_save_changed.connect(func, sender=UnhashableModel)
+
+            obj = UnhashableModel()
+            post_init.send(instance=obj, sender=UnhashableModel)
+
+            obj.a_key = "another value"
+            pre_save.send(instance=obj, sender=UnhashableModel)
+        assert func.kwargs["changed_fields"] == {"a_key": ("a value", "another value")}
+
+    def test_untracked_sender_has_no_listeners(self):
+        class TrackedModel(FakeModel):
+            pass
+
+        class UntrackedModel(FakeModel):
+            pass
+
+        pre_save_changed.connect(func, sender=TrackedModel)
+        post_save_changed.connect(func, sender=TrackedModel)
+
+        for signal in (post_init, pre_save, post_save):
+            assert signal.has_listeners(TrackedModel)
+            assert not signal.has_listeners(UntrackedModel)
+
+    @pytest.mark.parametrize("pk, created", [(None, True), (1, False)])
+    def test_mixin(self, pk, created):
+        class MixinModel(signals.FieldSignalsMixin, SavingModel):
+            pass
+
+        with must_be_called(True) as pre_func, must_be_called(True) as post_func:
+            pre_save_changed.connect(pre_func, sender=MixinModel)
+            post_save_changed.connect(post_func, sender=MixinModel)
+
+            # The mixin does the work instead of the model signals
+            for signal in (post_init, pre_save, post_save):
+                assert not signal.has_listeners(MixinModel)
+
+            # An unsaved instance, which may have the pk of an existing row
+            obj = MixinModel(pk=pk)
+            obj.a_key = "another value"
+            obj.save_base(using="other")
+        assert pre_func.kwargs["changed_fields"] == {
+            "a_key": ("a value", "another value")
+        }
+        assert post_func.kwargs["changed_fields"] == {
+            "a_key": ("a value", "another value")
+        }
+        assert post_func.kwargs["created"] is created
+        assert post_func.kwargs["using"] == "other"
+
+    def test_mixin_pre_save_order(self):
+        """
+        FieldSignalsMixin calls pre_save_changed receivers before any pre_save
+        receivers, so changes made by pre_save receivers are seen by the next save.
+        """
+
+        class OrderModel(signals.FieldSignalsMixin, SavingModel):
+            pass
+
+        def set_a_key(sender, instance, **kwargs):
+            instance.a_key = instance.another
+
+        pre_save.connect(set_a_key, sender=OrderModel)
+        try:
+            with must_be_called(True) as func:
+                pre_save_changed.connect(func, sender=OrderModel, fields=("a_key",))
+
+                obj = OrderModel()
+                obj.another = "A"
+                obj.save_base()
+                # Not seen by pre_save_changed yet
+                assert obj.a_key == "A"
+                assert func.args is None
+
+                obj.another = "B"
+                obj.save_base()
+            assert func.kwargs["changed_fields"] == {"a_key": ("a value", "A")}
+        finally:
+            pre_save.disconnect(set_a_key, sender=OrderModel)
+
+    def test_duplicate_field_names(self):
+        class DuplicatesModel(DeferredModel):
+            pass
+
+        with must_be_called(True) as func:
+            pre_save_changed.connect(
+                func, sender=DuplicatesModel, fields=("a", "a", "b", "a")
+            )
+
+            obj = DuplicatesModel()
+            post_init.send(instance=obj, sender=DuplicatesModel)
+            # Only one original value is stored per field
+            assert obj._fieldsignals_originals == [1, None]
+
+            obj.a = 2
+            pre_save.send(instance=obj, sender=DuplicatesModel)
+        assert func.kwargs["changed_fields"] == {"a": (1, 2)}
+
+
+@pytest.mark.parametrize(
+    "signal, source_signal",
+    [(pre_save_changed, pre_save), (post_save_changed, post_save)],
+)
+class TestSave(object):
     @pytest.fixture(autouse=True)
-    def unready(self):
+    def ready(self):
         apps.models_ready = True
 
-    def test_pre_save_unchanged(self):
+    def test_unchanged(self, signal, source_signal):
         with must_be_called(False) as func:
-            pre_save_changed.connect(func, sender=FakeModel)
+            signal.connect(func, sender=FakeModel)
 
             obj = FakeModel()
-
             # post_init sets list of initial values
             post_init.send(instance=obj, sender=FakeModel)
-            # This *doesn't* call pre_save_changed, because we haven't changed anything.
-            pre_save.send(instance=obj, sender=FakeModel)
+            # This *doesn't* call the signal, because we haven't changed anything.
+            source_signal.send(instance=obj, sender=FakeModel)
 
-    def test_pre_save_changed(self):
+    def test_changed(self, signal, source_signal):
         with must_be_called(True) as func:
-            pre_save_changed.connect(func, sender=FakeModel)
+            signal.connect(func, sender=FakeModel)
 
             obj = FakeModel()
-
-            # post_init sets list of initial values
             post_init.send(instance=obj, sender=FakeModel)
 
             obj.a_key = "another value"
-            pre_save.send(instance=obj, sender=FakeModel)
-
+            source_signal.send(instance=obj, sender=FakeModel)
         assert func.kwargs["changed_fields"] == {"a_key": ("a value", "another value")}
+        assert func.kwargs["sender"] is FakeModel
+        assert func.kwargs["signal"] is signal
+        assert func.kwargs["instance"] is obj
 
-    def test_pre_save_with_fields_changed(self):
+    def test_with_fields_changed(self, signal, source_signal):
         with must_be_called(True) as func:
-            pre_save_changed.connect(func, sender=FakeModel, fields=("a_key",))
+            signal.connect(func, sender=FakeModel, fields=("a_key",))
 
             obj = FakeModel()
             post_init.send(instance=obj, sender=FakeModel)
 
             obj.a_key = "change a field that we care about"
-            pre_save.send(instance=obj, sender=FakeModel)
+            source_signal.send(instance=obj, sender=FakeModel)
         assert func.kwargs["changed_fields"] == {
             "a_key": ("a value", "change a field that we care about")
         }
 
-    def test_pre_save_with_fields_unchanged(self):
+    def test_with_fields_unchanged(self, signal, source_signal):
         with must_be_called(False) as func:
-            pre_save_changed.connect(func, sender=FakeModel, fields=("a_key",))
+            signal.connect(func, sender=FakeModel, fields=("a_key",))
 
             obj = FakeModel()
             post_init.send(instance=obj, sender=FakeModel)
 
             obj.another = "dont care about this field"
-            pre_save.send(instance=obj, sender=FakeModel)
+            source_signal.send(instance=obj, sender=FakeModel)